@@ -1,11 +1,15 @@
 import streamlit as st
 import numpy as np
 import cv2
+import queue
+import shutil
 import tempfile
+import threading
 import os
+import hashlib
 import matplotlib.pyplot as plt
 from PIL import Image
-from movement_detector.detector import CameraMovementDetector
+from movement_detector.detector import CameraMovementDetector, preprocess_frame
 from movement_detector.scoring import classify_movement_type
 from typing import List, Dict, Any
 import base64
@@ -30,6 +34,107 @@ st.markdown(get_custom_css(), unsafe_allow_html=True)
 def display_title():
     st.markdown(get_title_html(), unsafe_allow_html=True)
 
+MAX_VIDEO_FRAMES = 200
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_detect(frames_hash, threshold_feature, threshold_homography, min_match_count, _frames):
+    """Run detection keyed on a content hash of the frames plus the detection
+    parameters, so widget-triggered reruns and re-uploads of the same data
+    reuse the previous result instead of re-running ORB. `_frames` is
+    underscore-prefixed so Streamlit skips hashing the raw arrays."""
+    detector = CameraMovementDetector(threshold_feature, threshold_homography, min_match_count)
+    return detector.detect(_frames)
+
+def _hash_frames(frames):
+    digest = hashlib.blake2b(digest_size=16)
+    for frame in frames:
+        digest.update(frame.tobytes())
+    return digest.hexdigest()
+
+def process_video_threaded(video_path, sample_rate, detector, progress_callback=None):
+    """Three-stage pipeline for the video tab: a reader thread decodes frames,
+    a compute thread extracts ORB features, and the calling thread runs the
+    sequential matching/homography stage via detector.detect_stream().
+    Decode of frame N+1, feature extraction on N and score aggregation on N-1
+    overlap; bounded queues keep RAM proportional to the queue size instead of
+    the whole video. Frames are not retained - the display path re-reads the
+    ones it needs from the file. Returns (result, num_analyzed, total_frames).
+    """
+    read_q = queue.Queue(maxsize=32)
+    feat_q = queue.Queue(maxsize=32)
+    cap = cv2.VideoCapture(video_path)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    num_analyzed = 0
+
+    # Worker exceptions are collected here and re-raised on the calling
+    # thread; the sentinels go out in finally blocks so a failing worker can
+    # never leave the downstream stage blocked on an empty queue.
+    worker_errors = []
+
+    def reader():
+        frame_count = 0
+        try:
+            while frame_count < MAX_VIDEO_FRAMES:
+                if frame_count % sample_rate == 0:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    read_q.put((frame_count, frame))
+                else:
+                    # grab() advances the stream without the YUV->BGR conversion
+                    # and frame materialization that read() pays on skipped frames
+                    if not cap.grab():
+                        break
+                frame_count += 1
+        except Exception as exc:
+            worker_errors.append(exc)
+        finally:
+            cap.release()
+            read_q.put(None)
+
+    def compute():
+        orb = cv2.ORB_create(nfeatures=2000, scaleFactor=1.2, nlevels=8)
+        try:
+            while True:
+                item = read_q.get()
+                if item is None:
+                    break
+                frame_count, frame = item
+                gray, scale = preprocess_frame(frame, detector.max_side)
+                kp, des = orb.detectAndCompute(gray, None)
+                feat_q.put((frame_count, gray, kp, des, scale))
+        except Exception as exc:
+            worker_errors.append(exc)
+            # Drain the reader so it can't stay blocked on a full queue
+            while read_q.get() is not None:
+                pass
+        finally:
+            feat_q.put(None)
+
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    compute_thread = threading.Thread(target=compute, daemon=True)
+    reader_thread.start()
+    compute_thread.start()
+
+    def feature_stream():
+        nonlocal num_analyzed
+        while True:
+            item = feat_q.get()
+            if item is None:
+                break
+            frame_count, gray, kp, des, scale = item
+            num_analyzed += 1
+            if progress_callback is not None:
+                progress_callback(frame_count, total_frames)
+            yield gray, kp, des, scale
+
+    result = detector.detect_stream(feature_stream())
+    reader_thread.join()
+    compute_thread.join()
+    if worker_errors:
+        raise worker_errors[0]
+    return result, num_analyzed, total_frames
+
 def main():
     # Display custom title
     display_title()
@@ -118,30 +223,42 @@ def main():
                 with st.spinner("Processing images..."):
                     # Add progress bar for visual feedback
                     progress_bar = st.progress(0)
-                    
-                    # Process frames
-                    detector = CameraMovementDetector(threshold_feature, threshold_homography, min_match_count)
-                    result = detector.detect(frames)
-                    
+
+                    # Process frames; cached across reruns on identical input
+                    result = _cached_detect(_hash_frames(frames), threshold_feature,
+                                            threshold_homography, min_match_count, frames)
+
                     # Complete the progress bar
                     progress_bar.progress(100)
-                    
-                    # Create tabs for different views of the results
-                    result_tabs = st.tabs(["📊 Analysis", "🖼️ Frames"])
-                    
-                    with result_tabs[0]:
-                        # Plot movement scores
-                        if len(result['movement_scores']) > 0:
-                            st.markdown("<h3>Movement Score Analysis</h3>", unsafe_allow_html=True)
-                            fig = plot_movement_scores(result)
-                            st.pyplot(fig)
-                        
-                        # Display movement details
-                        display_movement_details(result)
-                    
-                    with result_tabs[1]:
-                        # Display all frames with movement indicators
-                        display_all_frames(frames, result['movement_indices'], original_total_frames=original_total_frames)
+
+                    # Keep results so widget interactions don't discard them
+                    st.session_state.image_results = {
+                        'frames': frames,
+                        'movement_data': result,
+                        'original_total_frames': original_total_frames
+                    }
+
+            if st.session_state.get('image_results'):
+                image_results = st.session_state.image_results
+
+                # Create tabs for different views of the results
+                result_tabs = st.tabs(["📊 Analysis", "🖼️ Frames"])
+
+                with result_tabs[0]:
+                    # Plot movement scores
+                    if len(image_results['movement_data']['movement_scores']) > 0:
+                        st.markdown("<h3>Movement Score Analysis</h3>", unsafe_allow_html=True)
+                        fig = plot_movement_scores(image_results['movement_data'])
+                        st.pyplot(fig)
+
+                    # Display movement details
+                    display_movement_details(image_results['movement_data'])
+
+                with result_tabs[1]:
+                    # Display all frames with movement indicators
+                    display_all_frames(image_results['frames'],
+                                       image_results['movement_data']['movement_indices'],
+                                       original_total_frames=image_results['original_total_frames'])
     
     with tab2:
         st.markdown("<h3>Video Analysis</h3>", unsafe_allow_html=True)
@@ -161,11 +278,29 @@ def main():
         )
         
         if video_file:
-            # Save uploaded video to temp file
-            tfile = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
-            tfile.write(video_file.read())
-            video_path = tfile.name
-            tfile.close()
+            # Persist the upload to a session-scoped temp file; the display
+            # path re-reads movement frames from it lazily after analysis,
+            # so it has to outlive the analysis run.
+            upload_key = (video_file.name, video_file.size)
+            if st.session_state.get('video_upload_key') != upload_key:
+                old_path = st.session_state.get('video_temp_path')
+                if old_path and os.path.exists(old_path):
+                    os.unlink(old_path)
+                # Chunked copy: video_file.read() would materialize the whole
+                # upload as a bytes object before writing it back out.
+                # OpenCV needs a real path, so the file stays a
+                # NamedTemporaryFile rather than a spooled in-memory one.
+                video_file.seek(0)
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tfile:
+                    shutil.copyfileobj(video_file, tfile, length=1 << 20)
+                video_file.seek(0)
+                st.session_state.video_temp_path = tfile.name
+                st.session_state.video_upload_key = upload_key
+                # Results from the previous upload point at the temp file
+                # unlinked above; drop them so a stale gallery can't render
+                st.session_state.video_analysis_complete = False
+                st.session_state.video_results = None
+            video_path = st.session_state.video_temp_path
             
             # Display video
             st.video(video_file)
@@ -194,55 +329,34 @@ def main():
                     status_text = st.empty()
                 
                 try:
-                    # Process video and extract all frames for display
-                    cap = cv2.VideoCapture(video_path)
-                    all_frames = []
-                    frames_for_analysis = []
-                    frame_count = 0
-                    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                    
-                    status_text.text(f"Extracting frames... (0/{total_frames})")
-                    
-                    while True:
-                        ret, frame = cap.read()
-                        if not ret:
-                            break
-                        # Maksimum 200 frame ile sınırla
-                        if frame_count >= 200:
-                            break
-                        # Update progress bar
-                        progress = min(100, int((frame_count / total_frames) * 50))  # 50% for frame extraction
+                    # Decode, feature extraction and matching run as a
+                    # threaded pipeline; this thread drives the sequential
+                    # matching stage and the progress UI.
+                    status_text.text("Analyzing video...")
+
+                    def update_progress(frame_count, total_frames):
+                        progress = min(100, int((frame_count / max(1, total_frames)) * 100))
                         progress_bar.progress(progress)
-                        status_text.text(f"Extracting frames... ({frame_count}/{total_frames})")
-                        # Store all frames for display
-                        all_frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                        # Only use every Nth frame for analysis
-                        if frame_count % sample_rate == 0:
-                            frames_for_analysis.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                        frame_count += 1
-                    
-                    cap.release()
-                    
-                    # Update progress for analysis phase
-                    progress_bar.progress(50)
-                    status_text.text("Analyzing camera movement...")
-                    
-                    # Process the sampled frames
+                        status_text.text(f"Analyzing frames... ({frame_count}/{total_frames})")
+
                     detector = CameraMovementDetector(threshold_feature, threshold_homography, min_match_count)
-                    result = detector.detect(frames_for_analysis)
-                    
+                    result, num_analyzed, total_frames = process_video_threaded(
+                        video_path, sample_rate, detector, progress_callback=update_progress)
+
                     # Convert movement indices from sampled frames to original video frames
                     original_movement_indices = [idx * sample_rate for idx in result['movement_indices']]
-                    
+
                     # Complete the progress bar
                     progress_bar.progress(100)
                     status_text.text("Analysis complete!")
-                    
+
                     # Store results in session state
                     st.session_state.video_results = {
-                        'all_frames': all_frames,
+                        'video_path': video_path,
                         'movement_data': result,
-                        'original_movement_indices': original_movement_indices
+                        'original_movement_indices': original_movement_indices,
+                        'num_analyzed': num_analyzed,
+                        'total_frames': total_frames
                     }
                     st.session_state.video_analysis_complete = True
                     
@@ -254,10 +368,6 @@ def main():
                 except Exception as e:
                     st.error(f"Error processing video: {str(e)}")
                     progress_placeholder.empty()
-                finally:
-                    # Clean up temp file
-                    if os.path.exists(video_path):
-                        os.unlink(video_path)
             
             # Display results if analysis is complete
             if st.session_state.video_analysis_complete and st.session_state.video_results:
@@ -279,8 +389,15 @@ def main():
                     display_movement_details(results['movement_data'])
                 
                 with result_tabs[1]:
-                    # Display all frames with movement indicators
-                    display_all_frames(results['all_frames'], results['original_movement_indices'], original_total_frames=total_frames)
+                    # Movement frames are re-read lazily from the temp file.
+                    # The truncation caption only applies when the frame cap
+                    # actually cut the video short; sampling alone makes
+                    # num_analyzed smaller without dropping coverage.
+                    truncated = results['total_frames'] > MAX_VIDEO_FRAMES
+                    display_all_frames(None, results['original_movement_indices'],
+                                       original_total_frames=results['total_frames'] if truncated else None,
+                                       video_path=results['video_path'],
+                                       num_analyzed=results['num_analyzed'])
                 
                 # Add a button to clear results and start over
                 if st.button("🔄 Analyze New Video", type="secondary"):
@@ -1,46 +1,205 @@
-from .features import extract_features, match_features
+from .features import extract_features, match_features, match_features_mutual_nn
 from .scoring import calculate_movement_score, classify_movement_type
 from .utils import calculate_frame_difference_score, calculate_optical_flow_score, calculate_edge_motion_score
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import cv2
 from typing import List, Dict, Any
 
+DEFAULT_MAX_SIDE = 640
+
+def preprocess_frame(frame: np.ndarray, max_side: int = DEFAULT_MAX_SIDE):
+    """Grayscale and downscale a frame for feature extraction.
+
+    ORB cost grows roughly quadratically with image dimension and ~640px on
+    the long side is plenty for camera-shake detection. No explicit blur:
+    ORB's scale pyramid already Gaussian-smooths each level, so a prior
+    GaussianBlur is just an extra full-frame memory pass. Returns
+    (gray, scale) where scale maps original coordinates to the downscaled
+    ones; pass it to the matching stage so homographies can be reported in
+    original pixels.
+    """
+    scale = 1.0
+    if max_side and max(frame.shape[:2]) > max_side:
+        scale = max_side / max(frame.shape[:2])
+    if len(frame.shape) == 3:
+        # Resize first so the grayscale conversion only touches the small
+        # image; both steps are memory-bound, so ordering them this way cuts
+        # the bytes moved by roughly the square of the downscale factor.
+        if scale != 1.0:
+            frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    else:
+        if scale != 1.0:
+            gray = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            gray = frame.copy()
+    return gray, scale
+
+def _matches_to_arrays(matches):
+    """Unpack a list of cv2.DMatch into (queryIdx, trainIdx, distance)
+    arrays - a struct-of-arrays layout that downstream filtering, sorting
+    and point gathering can process contiguously."""
+    n = len(matches)
+    q_idx = np.fromiter((m.queryIdx for m in matches), dtype=np.int32, count=n)
+    t_idx = np.fromiter((m.trainIdx for m in matches), dtype=np.int32, count=n)
+    dist = np.fromiter((m.distance for m in matches), dtype=np.float32, count=n)
+    return q_idx, t_idx, dist
+
+def cuda_available() -> bool:
+    """True when OpenCV was built with CUDA and a device is present."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
 class CameraMovementDetector:
-    def __init__(self, threshold_feature: float = 5.0, threshold_homography: float = 15.0, min_match_count: int = 8):
+    def __init__(self, threshold_feature: float = 5.0, threshold_homography: float = 15.0, min_match_count: int = 8,
+                 max_side: int = DEFAULT_MAX_SIDE, use_cuda: bool = False):
         self.threshold_feature = threshold_feature
         self.threshold_homography = threshold_homography
         self.min_match_count = min_match_count
+        self.max_side = max_side
+        self.use_cuda = use_cuda and cuda_available()
 
     def detect(self, frames: List[np.ndarray]) -> Dict[str, Any]:
+        if self.use_cuda:
+            try:
+                return self.detect_stream(self._cuda_feature_stream(frames))
+            except cv2.error:
+                # CUDA context/allocation failure - fall through to CPU
+                pass
+        # Feature extraction is independent per frame and ORB releases the
+        # GIL, so it runs across a thread pool; matching stays sequential.
+        local = threading.local()
+
+        def extract(frame):
+            orb = getattr(local, 'orb', None)
+            if orb is None:
+                # One ORB per worker thread - detectAndCompute is stateful
+                orb = cv2.ORB_create(nfeatures=2000, scaleFactor=1.2, nlevels=8)
+                local.orb = orb
+            gray, scale = preprocess_frame(frame, self.max_side)
+            kp, des = orb.detectAndCompute(gray, None)
+            return gray, kp, des, scale
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            features = list(pool.map(extract, frames))
+        return self.detect_stream(features)
+
+    def _cuda_feature_stream(self, frames):
+        """Extract ORB features on the GPU, double-buffered across two CUDA
+        streams so the upload of frame N+1 overlaps detection on frame N.
+        Matching/homography stays on the CPU via detect_stream() - those
+        operate on small arrays where transfer would dominate."""
+        gpu_orb = cv2.cuda.ORB_create(nfeatures=2000, scaleFactor=1.2, nlevels=8)
+        streams = (cv2.cuda.Stream(), cv2.cuda.Stream())
+        bufs = (cv2.cuda_GpuMat(), cv2.cuda_GpuMat())
+        pending = []
+
+        def drain(entry):
+            gray, scale, kp_gpu, des_gpu, stream = entry
+            stream.waitForCompletion()
+            kp = gpu_orb.convert(kp_gpu)
+            des = des_gpu.download()
+            return gray, kp, des, scale
+
+        for i, frame in enumerate(frames):
+            gray, scale = preprocess_frame(frame, self.max_side)
+            stream = streams[i % 2]
+            buf = bufs[i % 2]
+            buf.upload(gray, stream)
+            kp_gpu, des_gpu = gpu_orb.detectAndComputeAsync(buf, None, stream=stream)
+            pending.append((gray, scale, kp_gpu, des_gpu, stream))
+            if len(pending) == 2:
+                yield drain(pending.pop(0))
+        while pending:
+            yield drain(pending.pop(0))
+
+    def detect_batched(self, frames: List[np.ndarray], batch: int = 16) -> Dict[str, Any]:
+        """Like detect(), but extracts features over a window of frames per
+        OpenCV call. detect()/compute() accept lists of images, so a window of
+        preprocessed frames crosses the Python/C++ boundary once instead of
+        once per frame. Matching stays sequential via detect_stream()."""
+        orb = cv2.ORB_create(nfeatures=2000, scaleFactor=1.2, nlevels=8)
+
+        def feature_stream():
+            for start in range(0, len(frames), batch):
+                grays = []
+                scales = []
+                for frame in frames[start:start + batch]:
+                    gray, scale = preprocess_frame(frame, self.max_side)
+                    grays.append(gray)
+                    scales.append(scale)
+                kps = list(orb.detect(grays, None))
+                kps, dess = orb.compute(grays, kps)
+                for gray, kp, des, scale in zip(grays, kps, dess, scales):
+                    yield gray, kp, des, scale
+
+        return self.detect_stream(feature_stream())
+
+    def detect_stream(self, features) -> Dict[str, Any]:
+        """Run the sequential matching/homography stage over an iterable of
+        (gray, keypoints, descriptors, scale) tuples. Feature extraction can
+        happen anywhere (another thread, a batch pass); this stage must stay
+        single-threaded because the pairwise state is sequential. `scale` is
+        the preprocess_frame() downscale factor so scores and stored
+        homographies stay in original pixel coordinates."""
         movement_indices = []
         movement_scores = []
         transformation_matrices = []
-        orb = cv2.ORB_create(nfeatures=2000, scaleFactor=1.2, nlevels=8)
-        bf = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
+        # FLANN with LSH is built for binary descriptors like ORB and turns
+        # the O(N*M) Hamming scan into approximate nearest-neighbor lookups.
+        # The vectorized mutual-NN matcher covers the exact small-count case
+        # where LSH tables are unreliable and a dense scan is cheap.
+        flann = cv2.FlannBasedMatcher(
+            dict(algorithm=6, table_number=6, key_size=12, multi_probe_level=1), {})
         prev_frame = None
-        prev_kp = None
+        prev_pts = None
         prev_des = None
-        for idx, frame in enumerate(frames):
-            if len(frame.shape) == 3:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = frame.copy()
-            gray = cv2.GaussianBlur(gray, (3, 3), 0)
-            kp, des = orb.detectAndCompute(gray, None)
+        for idx, (gray, kp, des, scale) in enumerate(features):
+            # KeyPoint_convert gives one contiguous float32 (N, 2) array per
+            # frame instead of boxing each .pt tuple during match extraction
+            cur_pts = cv2.KeyPoint_convert(kp) if kp else np.empty((0, 2), dtype=np.float32)
             if prev_frame is not None and prev_des is not None and des is not None:
                 movement_score = 0
                 H = None
                 if len(prev_des) > 0 and len(des) > 0:
-                    matches = bf.match(prev_des, des)
-                    matches = sorted(matches, key=lambda x: x.distance)
-                    good_matches = []
-                    if len(matches) > 0:
-                        distance_threshold = min(50, matches[0].distance * 2.5)
-                        good_matches = [m for m in matches if m.distance < distance_threshold]
-                    if len(good_matches) >= self.min_match_count:
-                        src_pts = np.float32([prev_kp[m.queryIdx].pt for m in good_matches]).reshape(-1, 1, 2)
-                        dst_pts = np.float32([kp[m.trainIdx].pt for m in good_matches]).reshape(-1, 1, 2)
-                        H, mask = cv2.findHomography(src_pts, dst_pts, cv2.RANSAC, ransacReprojThreshold=3.0, maxIters=1000)
+                    # DMatch objects are unpacked into flat index/distance
+                    # arrays straight away; filtering and sorting then run as
+                    # vectorized array ops instead of per-object attribute
+                    # access over Python match lists.
+                    if min(len(prev_des), len(des)) < 50:
+                        q_idx, t_idx, dist = match_features_mutual_nn(prev_des, des)
+                        if len(dist) > 0:
+                            keep = dist < min(50, dist[0] * 2.5)
+                            q_idx, t_idx = q_idx[keep], t_idx[keep]
+                    else:
+                        knn_matches = flann.knnMatch(prev_des, des, k=2)
+                        pairs = [p for p in knn_matches if len(p) == 2]
+                        q_idx, t_idx, dist = _matches_to_arrays([p[0] for p in pairs])
+                        second = np.fromiter((p[1].distance for p in pairs), dtype=np.float32, count=len(pairs))
+                        keep = dist < 0.75 * second
+                        q_idx, t_idx, dist = q_idx[keep], t_idx[keep], dist[keep]
+                        order = np.argsort(dist)
+                        q_idx, t_idx = q_idx[order], t_idx[order]
+                    num_good = len(q_idx)
+                    if num_good >= self.min_match_count:
+                        src_pts = prev_pts[q_idx].reshape(-1, 1, 2)
+                        dst_pts = cur_pts[t_idx].reshape(-1, 1, 2)
+                        # PROSAC exploits the distance-sorted match order
+                        # (best correspondences first), converging in far
+                        # fewer iterations than uniform RANSAC sampling
+                        H, mask = cv2.findHomography(src_pts, dst_pts, cv2.USAC_PROSAC, ransacReprojThreshold=3.0, maxIters=200)
+                        if scale != 1.0:
+                            # Map points and homography back to original pixels
+                            src_pts = src_pts / scale
+                            dst_pts = dst_pts / scale
+                            if H is not None:
+                                S = np.diag([scale, scale, 1.0])
+                                H = np.linalg.inv(S) @ H @ S
                         if H is not None:
                             movement_score = calculate_movement_score(H, src_pts, dst_pts)
                             if movement_score > self.threshold_homography:
@@ -49,15 +208,20 @@ class CameraMovementDetector:
                             movement_score = calculate_movement_score(None, src_pts, dst_pts)
                             if movement_score > self.threshold_homography * 0.5:
                                 movement_indices.append(idx)
-                    if movement_score == 0 or len(good_matches) < self.min_match_count:
-                        scores = []
-                        diff_score = calculate_frame_difference_score(prev_frame, gray)
-                        scores.append(diff_score)
-                        flow_score = calculate_optical_flow_score(prev_frame, gray)
-                        scores.append(flow_score)
-                        edge_score = calculate_edge_motion_score(prev_frame, gray)
-                        scores.append(edge_score)
-                        movement_score = max(scores) if scores else 0
+                    if movement_score == 0 or num_good < self.min_match_count:
+                        # Cheapest scorer first; later ones only raise the max,
+                        # so once movement is clearly flagged (2x margin) the
+                        # more expensive scorers can't change the outcome.
+                        movement_score = calculate_frame_difference_score(prev_frame, gray)
+                        if movement_score <= self.threshold_feature * 2:
+                            edge_score = calculate_edge_motion_score(prev_frame, gray)
+                            movement_score = max(movement_score, edge_score)
+                        if movement_score <= self.threshold_feature * 2:
+                            # The flow median is measured on the downscaled
+                            # working frame; divide by scale so it lands in
+                            # original pixels like the homography path
+                            flow_score = calculate_optical_flow_score(prev_frame, gray) / scale
+                            movement_score = max(movement_score, flow_score)
                         if movement_score > self.threshold_feature:
                             movement_indices.append(idx)
                     movement_scores.append(movement_score)
@@ -70,7 +234,7 @@ class CameraMovementDetector:
                     movement_scores.append(0)
                     transformation_matrices.append(None)
             prev_frame = gray
-            prev_kp = kp
+            prev_pts = cur_pts
             prev_des = des
         return {
             'movement_indices': movement_indices,
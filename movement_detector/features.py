@@ -1,21 +1,79 @@
 import cv2
 import numpy as np
+import threading
 from typing import Any
 
-def extract_features(frame: np.ndarray) -> Any:
-    orb = cv2.ORB_create(nfeatures=2000, scaleFactor=1.2, nlevels=8)
+MAX_FEATURES = 2000
+
+# Detector and matchers are cached at module scope so external callers pay
+# the construction cost (pyramid scratch buffers, LSH tables) once instead of
+# per frame. OpenCV ORB is stateful, so calls go through a lock; pass your own
+# `orb` instance (e.g. one per worker thread) to skip the shared one.
+_orb_lock = threading.Lock()
+_flann_lock = threading.Lock()
+_ORB = cv2.ORB_create(nfeatures=MAX_FEATURES, scaleFactor=1.2, nlevels=8)
+_BF = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
+_FLANN = cv2.FlannBasedMatcher(
+    dict(algorithm=6, table_number=6, key_size=12, multi_probe_level=1), {})
+
+def adaptive_nfeatures(shape) -> int:
+    """Scale the feature budget with image area; 2000 features on a small
+    thumbnail is pure overhead in both detection and matching."""
+    return max(100, min(MAX_FEATURES, (shape[0] * shape[1]) // 500))
+
+def extract_features(frame: np.ndarray, orb: Any = None) -> Any:
     if len(frame.shape) == 3:
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
     else:
         gray = frame.copy()
-    gray = cv2.GaussianBlur(gray, (3, 3), 0)
-    kp, des = orb.detectAndCompute(gray, None)
+    # No pre-blur: ORB's pyramid already Gaussian-smooths each level
+    nfeatures = adaptive_nfeatures(gray.shape)
+    if orb is not None:
+        orb.setMaxFeatures(nfeatures)
+        return orb.detectAndCompute(gray, None)
+    with _orb_lock:
+        _ORB.setMaxFeatures(nfeatures)
+        kp, des = _ORB.detectAndCompute(gray, None)
     return kp, des
 
+# Byte-wise popcount lookup table for NumPy builds without bitwise_count
+_POPCOUNT_LUT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint16)
+
+def match_features_mutual_nn(des1, des2):
+    """Mutual-nearest-neighbor Hamming matching as one dense vectorized pass.
+
+    Packs the 32-byte ORB descriptors into uint64 lanes, computes the full
+    pairwise Hamming distance matrix with XOR + popcount, then keeps pairs
+    that are each other's nearest neighbor. Equivalent to brute-force
+    matching with crossCheck=True but without materializing DMatch objects,
+    so it suits the small-descriptor-count case. Returns (queryIdx,
+    trainIdx, distance) arrays sorted by ascending distance.
+    """
+    a = np.ascontiguousarray(des1).view(np.uint64)
+    b = np.ascontiguousarray(des2).view(np.uint64)
+    x = a[:, None, :] ^ b[None, :, :]
+    if hasattr(np, 'bitwise_count'):
+        dist = np.bitwise_count(x).sum(-1, dtype=np.uint16)
+    else:
+        dist = _POPCOUNT_LUT[x.view(np.uint8)].sum(-1, dtype=np.uint16)
+    nn12 = dist.argmin(axis=1)
+    nn21 = dist.argmin(axis=0)
+    mutual = np.arange(len(nn12)) == nn21[nn12]
+    q_idx = np.nonzero(mutual)[0].astype(np.int32)
+    t_idx = nn12[q_idx].astype(np.int32)
+    d = dist[q_idx, t_idx].astype(np.float32)
+    order = np.argsort(d)
+    return q_idx[order], t_idx[order], d[order]
+
 def match_features(des1, des2) -> Any:
-    bf = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
-    if des1 is not None and des2 is not None and len(des1) > 0 and len(des2) > 0:
-        matches = bf.match(des1, des2)
-        matches = sorted(matches, key=lambda x: x.distance)
-        return matches
-    return [] 
\ No newline at end of file
+    if des1 is None or des2 is None or len(des1) == 0 or len(des2) == 0:
+        return []
+    if min(len(des1), len(des2)) < 50:
+        matches = _BF.match(des1, des2)
+        return sorted(matches, key=lambda x: x.distance)
+    with _flann_lock:
+        knn_matches = _FLANN.knnMatch(des1, des2, k=2)
+    good = [pair[0] for pair in knn_matches
+            if len(pair) == 2 and pair[0].distance < 0.75 * pair[1].distance]
+    good.sort(key=lambda x: x.distance)
+    return good
@@ -1,22 +1,63 @@
 # scoring.py
+import math
+import types
 import numpy as np
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
+
+# Shared read-only result for frames without a homography; the fallback path
+# can hit this thousands of times per video, so don't allocate a fresh dict
+# of the same five zeros each call.
+_NULL_CLASSIFICATION = types.MappingProxyType({
+    'translation_x': 0.0,
+    'translation_y': 0.0,
+    'rotation': 0.0,
+    'scaling': 1.0,
+    'perspective': 0.0
+})
+
+# Numba is an optional accelerator: when available, the per-pair displacement
+# reduction is JIT-compiled to native code; otherwise the NumPy path is used.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _disp_stats_numpy(src: np.ndarray, dst: np.ndarray):
+    displacements = np.linalg.norm(dst - src, axis=1)
+    median = float(np.median(displacements))
+    variance = float(np.var(displacements)) if len(displacements) > 1 else 0.0
+    return median, variance
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _disp_stats(src, dst):
+        n = src.shape[0]
+        d = np.empty(n)
+        for i in range(n):
+            dx = dst[i, 0] - src[i, 0]
+            dy = dst[i, 1] - src[i, 1]
+            d[i] = math.sqrt(dx * dx + dy * dy)
+        median = float(np.median(d))
+        variance = float(np.var(d)) if n > 1 else 0.0
+        return median, variance
+else:
+    _disp_stats = _disp_stats_numpy
 
 def calculate_movement_score(H: np.ndarray, src_pts: np.ndarray, dst_pts: np.ndarray) -> float:
+    # Scalar math.* calls here: this runs once per frame pair on a handful of
+    # floats, where NumPy's per-call dispatch costs more than the arithmetic.
     if H is not None:
         try:
-            translation_x = H[0, 2]
-            translation_y = H[1, 2]
-            translation_magnitude = np.sqrt(translation_x**2 + translation_y**2)
-            rotation_angle = np.arctan2(H[1, 0], H[0, 0])
-            rotation_magnitude = np.abs(rotation_angle)
-            scale_x = np.sqrt(H[0, 0]**2 + H[1, 0]**2)
-            scale_y = np.sqrt(H[0, 1]**2 + H[1, 1]**2)
-            scale_change = np.abs(1.0 - (scale_x + scale_y) / 2)
-            perspective_dist = np.abs(H[2, 0]) + np.abs(H[2, 1])
+            translation_magnitude = math.hypot(H[0, 2], H[1, 2])
+            rotation_magnitude = abs(math.atan2(H[1, 0], H[0, 0]))
+            scale_x = math.hypot(H[0, 0], H[1, 0])
+            scale_y = math.hypot(H[0, 1], H[1, 1])
+            scale_change = abs(1.0 - (scale_x + scale_y) / 2)
+            perspective_dist = abs(H[2, 0]) + abs(H[2, 1])
             if len(src_pts) > 0 and len(dst_pts) > 0:
-                displacements = np.linalg.norm(dst_pts.reshape(-1, 2) - src_pts.reshape(-1, 2), axis=1)
-                displacement_variance = np.var(displacements) if len(displacements) > 1 else 0
+                _, displacement_variance = _disp_stats(
+                    np.ascontiguousarray(src_pts.reshape(-1, 2), dtype=np.float64),
+                    np.ascontiguousarray(dst_pts.reshape(-1, 2), dtype=np.float64))
             else:
                 displacement_variance = 0
             movement_score = (
@@ -27,39 +68,58 @@ def calculate_movement_score(H: np.ndarray, src_pts: np.ndarray, dst_pts: np.nda
                 displacement_variance * 0.1
             )
             return float(movement_score)
-        except:
+        except (ValueError, TypeError, IndexError):
+            # Malformed H or point arrays score zero; anything else
+            # (including Numba compile errors in _disp_stats) propagates
             return 0.0
     else:
         try:
             if len(src_pts) == 0 or len(dst_pts) == 0:
                 return 0.0
-            displacements = np.linalg.norm(dst_pts.reshape(-1, 2) - src_pts.reshape(-1, 2), axis=1)
-            median_displacement = np.median(displacements)
-            displacement_variance = np.var(displacements)
+            median_displacement, displacement_variance = _disp_stats(
+                np.ascontiguousarray(src_pts.reshape(-1, 2), dtype=np.float64),
+                np.ascontiguousarray(dst_pts.reshape(-1, 2), dtype=np.float64))
             return float(median_displacement + displacement_variance * 0.1)
-        except:
+        except (ValueError, TypeError, IndexError):
             return 0.0
 
-def classify_movement_type(transformation_matrix: np.ndarray) -> Dict[str, float]:
+def classify_movement_types_bulk(matrices) -> list:
+    """Vectorized classify_movement_type over a stack of homographies.
+
+    Decomposes all matrices with a handful of array ops on the (N, 3, 3)
+    stack instead of N Python calls, then unpacks to per-frame dicts for
+    display. Matches classify_movement_type component-for-component
+    (including the |h20|+|h21| perspective term).
+    """
+    M = np.asarray(matrices, dtype=np.float64)
+    if M.size == 0:
+        return []
+    tx = M[:, 0, 2]
+    ty = M[:, 1, 2]
+    rotation = np.degrees(np.arctan2(M[:, 1, 0], M[:, 0, 0]))
+    scaling = (np.hypot(M[:, 0, 0], M[:, 1, 0]) + np.hypot(M[:, 0, 1], M[:, 1, 1])) / 2
+    perspective = np.abs(M[:, 2, 0]) + np.abs(M[:, 2, 1])
+    return [{
+        'translation_x': float(tx[i]),
+        'translation_y': float(ty[i]),
+        'rotation': float(rotation[i]),
+        'scaling': float(scaling[i]),
+        'perspective': float(perspective[i])
+    } for i in range(M.shape[0])]
+
+def classify_movement_type(transformation_matrix: np.ndarray) -> Mapping[str, float]:
     if transformation_matrix is None:
-        return {
-            'translation_x': 0.0,
-            'translation_y': 0.0,
-            'rotation': 0.0,
-            'scaling': 1.0,
-            'perspective': 0.0
-        }
-    translation_x = transformation_matrix[0, 2]
-    translation_y = transformation_matrix[1, 2]
-    rotation = np.degrees(np.arctan2(transformation_matrix[1, 0], transformation_matrix[0, 0]))
-    scaling_x = np.sqrt(transformation_matrix[0, 0]**2 + transformation_matrix[1, 0]**2)
-    scaling_y = np.sqrt(transformation_matrix[0, 1]**2 + transformation_matrix[1, 1]**2)
-    scaling = (scaling_x + scaling_y) / 2
-    perspective = np.abs(transformation_matrix[2, 0]) + np.abs(transformation_matrix[2, 1])
+        return _NULL_CLASSIFICATION
+    # Scalar math on six matrix entries - same reasoning as
+    # calculate_movement_score, NumPy dispatch would dominate here
+    rotation = math.degrees(math.atan2(transformation_matrix[1, 0], transformation_matrix[0, 0]))
+    scaling_x = math.hypot(transformation_matrix[0, 0], transformation_matrix[1, 0])
+    scaling_y = math.hypot(transformation_matrix[0, 1], transformation_matrix[1, 1])
+    perspective = abs(transformation_matrix[2, 0]) + abs(transformation_matrix[2, 1])
     return {
-        'translation_x': float(translation_x),
-        'translation_y': float(translation_y),
+        'translation_x': float(transformation_matrix[0, 2]),
+        'translation_y': float(transformation_matrix[1, 2]),
         'rotation': float(rotation),
-        'scaling': float(scaling),
+        'scaling': float((scaling_x + scaling_y) / 2),
         'perspective': float(perspective)
     } 
\ No newline at end of file
@@ -3,37 +3,78 @@ import matplotlib.pyplot as plt
 import numpy as np
 import cv2
 import base64
+import hashlib
+from datetime import datetime
 from typing import Dict, Any
-from movement_detector.scoring import classify_movement_type
+from movement_detector.scoring import classify_movement_types_bulk
+from movement_detector.utils import image_to_base64
 
-def plot_movement_scores(movement_data: Dict[str, Any]) -> plt.Figure:
-    plt.style.use('seaborn-v0_8-darkgrid')
+# Applied once at import; plt.style.use re-parses the style sheet on every
+# call, which adds up since Streamlit reruns the script per interaction
+plt.style.use('seaborn-v0_8-darkgrid')
+
+@st.cache_resource
+def _get_score_fig():
+    """One figure/axes pair per session, redrawn in place - avoids
+    allocating a fresh Matplotlib canvas on every rerun."""
     fig, ax = plt.subplots(figsize=(12, 5))
     fig.patch.set_facecolor('#f0f2f6')
-    scores = movement_data['movement_scores']
-    frames = list(range(len(scores)))
+    return fig, ax
+
+def plot_movement_scores(movement_data: Dict[str, Any]) -> plt.Figure:
+    fig, ax = _get_score_fig()
+    ax.clear()
+    scores = np.asarray(movement_data['movement_scores'], dtype=float)
+    frames = np.arange(len(scores))
     ax.plot(frames, scores, color='#1e3d59', linewidth=2, alpha=0.7)
     ax.fill_between(frames, scores, color='#1e3d59', alpha=0.1)
-    movement_indices = movement_data['movement_indices']
-    valid_indices = [i for i in movement_indices if i < len(scores)]
-    if valid_indices:
-        movement_scores = [scores[i] for i in valid_indices]
+    movement_indices = np.asarray(movement_data['movement_indices'], dtype=np.int64)
+    valid_indices = movement_indices[movement_indices < scores.size]
+    movement_scores = scores[valid_indices]
+    if valid_indices.size:
         ax.scatter(valid_indices, movement_scores, color='#ff6e40', s=100, zorder=5, \
                   label='Movement Detected', edgecolor='white', linewidth=1.5)
     ax.set_xlabel('Frame Number', fontsize=12, fontweight='bold')
     ax.set_ylabel('Movement Score', fontsize=12, fontweight='bold')
     ax.set_title('Camera Movement Detection Analysis', fontsize=16, fontweight='bold', pad=20)
     ax.grid(True, alpha=0.3, linestyle='--')
-    if valid_indices and len(scores) > 0:
-        threshold = min([scores[i] for i in valid_indices])
+    if valid_indices.size and scores.size > 0:
+        threshold = float(movement_scores.min())
         ax.axhline(y=threshold, color='#ff6e40', linestyle='--', alpha=0.7, \
                   label=f'Threshold: {threshold:.2f}')
     ax.legend(loc='upper right', frameon=True, facecolor='white')
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
+@st.cache_data(show_spinner=False, max_entries=256)
+def _classify_bulk_cached(mats_bytes: bytes, shape: tuple) -> list:
+    """Memoized bulk decomposition, keyed on the stacked matrix bytes. The
+    matrices are stable for the lifetime of an analysis, so reruns triggered
+    by expander toggles or unrelated widgets hit the cache, and a cache miss
+    decomposes the whole stack in one vectorized pass."""
+    mats = np.frombuffer(mats_bytes, dtype=np.float64).reshape(shape)
+    return classify_movement_types_bulk(mats)
+
+def _get_report_text(movement_data: Dict[str, Any], total_frames: int) -> str:
+    """Build the summary report once per analysis and keep it in
+    st.session_state; later reruns (widget clicks, expander toggles) hand
+    the download button the stored string. Timestamped at first build, which
+    also keeps the report stable across reruns of the same analysis."""
+    artifacts = st.session_state.setdefault('analysis_artifacts', {})
+    key = ('report', tuple(movement_data['movement_indices']), total_frames)
+    report_text = artifacts.get(key)
+    if report_text is None:
+        report_text = create_simple_report(movement_data, total_frames)
+        while len(artifacts) > 8:
+            artifacts.pop(next(iter(artifacts)))
+        artifacts[key] = report_text
+    return report_text
+
 def display_movement_details(movement_data: Dict[str, Any]) -> None:
     movement_indices = movement_data['movement_indices']
+    # Single report computation shared by both branches below
+    total_frames = len(movement_data.get('movement_scores', []))
+    report_text = _get_report_text(movement_data, total_frames) if total_frames > 0 else None
     if not movement_indices:
         st.markdown("""
         <div class="info-box">
@@ -41,9 +82,7 @@ def display_movement_details(movement_data: Dict[str, Any]) -> None:
             <p>No significant camera movement detected in the analyzed frames.</p>
         </div>
         """, unsafe_allow_html=True)
-        total_frames = len(movement_data.get('movement_scores', []))
-        if total_frames > 0:
-            report_text = create_simple_report(movement_data, total_frames)
+        if report_text is not None:
             st.download_button(
                 label="📄 Download Summary Report",
                 data=report_text,
@@ -59,9 +98,7 @@ def display_movement_details(movement_data: Dict[str, Any]) -> None:
         <p>Movement detected at frames: {', '.join(map(str, movement_indices))}</p>
     </div>
     """, unsafe_allow_html=True)
-    total_frames = len(movement_data.get('movement_scores', []))
-    if total_frames > 0:
-        report_text = create_simple_report(movement_data, total_frames)
+    if report_text is not None:
         st.download_button(
             label="📄 Download Summary Report",
             data=report_text,
@@ -69,23 +106,31 @@ def display_movement_details(movement_data: Dict[str, Any]) -> None:
             mime="text/plain",
             help="Download a simple summary of the movement detection results"
         )
-    if 'transformation_matrices' in movement_data:
+    mats = movement_data.get('transformation_matrices')
+    if mats is not None:
+        # Hoist the list and bounds check out of the loop; also keeps the
+        # classification input list free of None matrices up front
+        n = len(mats)
+        valid_idx = [idx for idx in movement_indices if idx < n and mats[idx] is not None]
         movement_types = []
-        for idx in movement_indices:
-            if idx < len(movement_data['transformation_matrices']):
-                matrix = movement_data['transformation_matrices'][idx]
-                if matrix is not None:
-                    movement_type = classify_movement_type(matrix)
-                    movement_types.append((idx, movement_type))
+        if valid_idx:
+            stacked = np.ascontiguousarray(np.stack([mats[i] for i in valid_idx]), dtype=np.float64)
+            movement_types = list(zip(valid_idx, _classify_bulk_cached(stacked.tobytes(), stacked.shape)))
         if movement_types:
             st.markdown("<h3>Movement Analysis</h3>", unsafe_allow_html=True)
-            for idx, movement_type in enumerate(movement_types):
-                frame_idx, movement_data = movement_type
+            # One shared scratch buffer for the per-frame arrow sketches;
+            # np.ones * 255 allocated (and wrote twice to) a fresh array
+            # for every expander
+            viz_size = 200
+            viz = np.empty((viz_size, viz_size, 3), dtype=np.uint8)
+            # `movement`, not `movement_data`: the old loop variable shadowed
+            # the outer results dict
+            for frame_idx, movement in movement_types:
                 movement_values = {
-                    'Translation': abs(movement_data['translation_x']) + abs(movement_data['translation_y']),
-                    'Rotation': abs(movement_data['rotation']),
-                    'Scaling': abs(movement_data['scaling'] - 1.0) * 100,
-                    'Perspective': movement_data['perspective'] * 10
+                    'Translation': abs(movement['translation_x']) + abs(movement['translation_y']),
+                    'Rotation': abs(movement['rotation']),
+                    'Scaling': abs(movement['scaling'] - 1.0) * 100,
+                    'Perspective': movement['perspective'] * 10
                 }
                 dominant_type = max(movement_values, key=lambda k: movement_values[k])
                 with st.expander(f"Frame {frame_idx} - Dominant Movement: {dominant_type}"):
@@ -94,34 +139,33 @@ def display_movement_details(movement_data: Dict[str, Any]) -> None:
                         st.markdown(f"""
                         <div style="padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
                             <h4>Translation</h4>
-                            <p>X-axis: {movement_data['translation_x']:.2f} pixels</p>
-                            <p>Y-axis: {movement_data['translation_y']:.2f} pixels</p>
+                            <p>X-axis: {movement['translation_x']:.2f} pixels</p>
+                            <p>Y-axis: {movement['translation_y']:.2f} pixels</p>
                         </div>
                         """, unsafe_allow_html=True)
                         st.markdown(f"""
                         <div style="padding: 10px; background-color: #f8f9fa; border-radius: 5px; margin-top: 10px;">
                             <h4>Rotation</h4>
-                            <p>{movement_data['rotation']:.2f} degrees</p>
+                            <p>{movement['rotation']:.2f} degrees</p>
                         </div>
                         """, unsafe_allow_html=True)
                     with col2:
                         st.markdown(f"""
                         <div style="padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
                             <h4>Scaling</h4>
-                            <p>{movement_data['scaling']:.2f}x</p>
+                            <p>{movement['scaling']:.2f}x</p>
                         </div>
                         """, unsafe_allow_html=True)
                         st.markdown(f"""
                         <div style="padding: 10px; background-color: #f8f9fa; border-radius: 5px; margin-top: 10px;">
                             <h4>Perspective Distortion</h4>
-                            <p>{movement_data['perspective']:.4f}</p>
+                            <p>{movement['perspective']:.4f}</p>
                         </div>
                         """, unsafe_allow_html=True)
                     st.markdown("<h4>Movement Visualization</h4>", unsafe_allow_html=True)
-                    tx = movement_data['translation_x']
-                    ty = movement_data['translation_y']
-                    viz_size = 200
-                    viz = np.ones((viz_size, viz_size, 3), dtype=np.uint8) * 255
+                    tx = movement['translation_x']
+                    ty = movement['translation_y']
+                    viz.fill(255)
                     center = (viz_size // 2, viz_size // 2)
                     scale = 50 / max(1, max(abs(tx), abs(ty)))
                     end_point = (
@@ -134,56 +178,154 @@ def display_movement_details(movement_data: Dict[str, Any]) -> None:
                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)
                     st.image(viz, use_column_width=False, width=200)
 
-def display_all_frames(frames, movement_indices=None, original_total_frames=None):
+def _load_video_frames(video_path, indices):
+    """Decode only the requested frames from a video file, seeking to each
+    index. Keeps the display path at O(movement frames) memory instead of
+    holding the whole decoded video."""
+    loaded = {}
+    cap = cv2.VideoCapture(video_path)
+    try:
+        for idx in sorted(set(indices)):
+            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+            ret, frame = cap.read()
+            if ret:
+                loaded[idx] = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    finally:
+        cap.release()
+    return loaded
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def _encode_jpeg(frame_bytes: bytes, shape: tuple, dtype: str) -> bytes:
+    """Encode a frame to JPEG, cached on the raw frame bytes so Streamlit
+    reruns (slider clicks, expander toggles) hit the cache instead of
+    re-running the encoder. JPEG at quality 85 is several times cheaper
+    and smaller than PNG for photographic frames."""
+    frame = np.frombuffer(frame_bytes, dtype=dtype).reshape(shape)
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    return buffer.tobytes()
+
+def _make_movement_label():
+    """Rasterize the fixed "MOVEMENT" overlay once at import. The string,
+    font, scale and color never change, so per-frame cv2.putText calls were
+    re-shaping and re-drawing identical glyphs; a sprite plus coverage mask
+    reduces the overlay to one masked copy."""
+    canvas = np.zeros((40, 160, 3), dtype=np.uint8)
+    cv2.putText(canvas, "MOVEMENT", (0, 30), \
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 110, 64), 2)
+    mask = canvas.any(axis=2)
+    return canvas, mask
+
+_LABEL_SPRITE, _LABEL_MASK = _make_movement_label()
+
+def _morton_key(col, row):
+    """Interleave the bits of (col, row) to get the cell's Z-order index."""
+    key = 0
+    for i in range(16):
+        key |= ((col >> i) & 1) << (2 * i) | ((row >> i) & 1) << (2 * i + 1)
+    return key
+
+@st.cache_resource(max_entries=8)
+def _prerender_movement_frames(cache_key, indices, _movement_frames, num_cols=4):
+    """Copy -> annotate -> encode each movement frame exactly once per
+    analysis, keyed on the frame source and index tuple. Reruns triggered by
+    unrelated widgets reuse the returned {frame_idx: jpeg_bytes} dict
+    instead of redrawing borders/labels and re-encoding. `_movement_frames`
+    is underscore-prefixed so Streamlit doesn't hash the arrays."""
+    # Z-order walk over the grid cells; see _morton_key
+    render_order = sorted(range(len(_movement_frames)),
+                          key=lambda k: _morton_key(k % num_cols, k // num_cols))
+    rendered = {}
+    border = np.array([255, 110, 64], dtype=np.uint8)
+    # One scratch buffer for all frames: copy-in is a single memcpy into
+    # already-hot pages rather than a fresh HD-sized allocation per frame.
+    # Safe because the encode below is synchronous, so nothing aliases the
+    # buffer past the iteration. Reallocated only if the frame shape changes
+    # (image uploads can mix sizes).
+    display_frame = None
+    for frame_list_idx in render_order:
+        original_frame_idx, frame = _movement_frames[frame_list_idx]
+        if display_frame is None or display_frame.shape != frame.shape:
+            display_frame = np.empty_like(frame)
+        np.copyto(display_frame, frame)
+        # Four contiguous slice stores beat cv2.rectangle's four line
+        # segments (and their Python->OpenCV crossings) for a solid border
+        display_frame[:5, :] = border
+        display_frame[-5:, :] = border
+        display_frame[:, :5] = border
+        display_frame[:, -5:] = border
+        # Blit the prerasterized label; sprite canvas rows/cols line up with
+        # the old putText origin of (10, 30)
+        sh, sw = _LABEL_MASK.shape
+        if display_frame.shape[0] >= sh and display_frame.shape[1] >= 10 + sw:
+            np.copyto(display_frame[:sh, 10:10 + sw], _LABEL_SPRITE,
+                      where=_LABEL_MASK[..., None])
+        else:
+            cv2.putText(display_frame, "MOVEMENT", (10, 30), \
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 110, 64), 2)
+        rendered[original_frame_idx] = _encode_jpeg(
+            display_frame.tobytes(), display_frame.shape, str(display_frame.dtype))
+    return rendered
+
+def display_all_frames(frames, movement_indices=None, original_total_frames=None, video_path=None, num_analyzed=None):
     st.markdown("<h3>Movement Detected Frames</h3>", unsafe_allow_html=True)
+    if num_analyzed is None:
+        num_analyzed = len(frames) if frames is not None else 0
     if movement_indices and len(movement_indices) > 0:
-        movement_frames = [(idx, frames[idx]) for idx in movement_indices if idx < len(frames)]
-        if original_total_frames is not None and original_total_frames > len(frames):
+        if video_path is not None:
+            loaded = _load_video_frames(video_path, movement_indices)
+            movement_frames = [(idx, loaded[idx]) for idx in movement_indices if idx in loaded]
+        else:
+            movement_frames = [(idx, frames[idx]) for idx in movement_indices if idx < len(frames)]
+        if original_total_frames is not None and original_total_frames > num_analyzed:
             st.markdown(f"""
             <div class="info-box">
-                <p>Displaying {len(movement_frames)} frames with detected camera movement (out of {len(frames)} total frames, original upload: {original_total_frames} frames, only first 200 processed)</p>
+                <p>Displaying {len(movement_frames)} frames with detected camera movement (out of {num_analyzed} total frames, original upload: {original_total_frames} frames, only first 200 processed)</p>
             </div>
             """, unsafe_allow_html=True)
         else:
             st.markdown(f"""
             <div class="info-box">
-                <p>Displaying {len(movement_frames)} frames with detected camera movement (out of {len(frames)} total frames)</p>
+                <p>Displaying {len(movement_frames)} frames with detected camera movement (out of {num_analyzed} total frames)</p>
             </div>
             """, unsafe_allow_html=True)
         num_cols = 4
-        st.markdown("<div class='frame-container'>", unsafe_allow_html=True)
-        for row_start in range(0, len(movement_frames), num_cols):
-            cols = st.columns(num_cols)
-            for col_idx in range(num_cols):
-                frame_list_idx = row_start + col_idx
-                if frame_list_idx < len(movement_frames):
-                    original_frame_idx, frame = movement_frames[frame_list_idx]
-                    display_frame = frame.copy()
-                    h, w = display_frame.shape[:2]
-                    cv2.rectangle(display_frame, (0, 0), (w-1, h-1), (255, 110, 64), 5)
-                    cv2.putText(display_frame, "MOVEMENT", (10, 30), \
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 110, 64), 2)
-                    frame_class = "movement-frame"
-                    caption_class = "movement-caption"
-                    caption = f"Frame {original_frame_idx} - MOVEMENT DETECTED"
-                    cols[col_idx].markdown(f"""
-                    <div class="{frame_class}">
-                        <img src="data:image/png;base64,{image_to_base64(display_frame)}" style="width: 100%;">
-                        <div class="frame-caption {caption_class}">{caption}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        if video_path is not None:
+            cache_key = video_path
+        else:
+            # Content hash, not id(frames): the cache_resource entry outlives
+            # the list it identifies, CPython recycles ids, and the cache is
+            # shared across sessions - same blake2b pattern as _hash_frames
+            # in app.py, restricted to the movement frames actually rendered
+            digest = hashlib.blake2b(digest_size=16)
+            for _, frame in movement_frames:
+                digest.update(frame.tobytes())
+            cache_key = digest.hexdigest()
+        rendered = _prerender_movement_frames(
+            cache_key, tuple(idx for idx, _ in movement_frames), movement_frames, num_cols)
+        # The whole gallery goes out as one CSS-grid markdown block: a
+        # single protobuf message per rerun instead of a st.columns() call
+        # per row and an st.image round-trip per cell
+        html_parts = ["<div class='frame-container'><div class='frame-grid'>"]
+        for original_frame_idx, _ in movement_frames:
+            b64 = base64.b64encode(rendered[original_frame_idx]).decode('ascii')
+            html_parts.append(
+                f"<div class='movement-frame'>"
+                f"<img src='data:image/jpeg;base64,{b64}' style='width:100%;'>"
+                f"<div class='frame-caption movement-caption'>Frame {original_frame_idx} - MOVEMENT DETECTED</div>"
+                f"</div>")
+        html_parts.append("</div></div>")
+        st.markdown(''.join(html_parts), unsafe_allow_html=True)
     else:
-        if original_total_frames is not None and original_total_frames > len(frames):
+        if original_total_frames is not None and original_total_frames > num_analyzed:
             st.markdown(f"""
             <div class="info-box">
-                <p>No camera movement detected in the analyzed video ({len(frames)} frames analyzed, original upload: {original_total_frames} frames, only first 200 processed)</p>
+                <p>No camera movement detected in the analyzed video ({num_analyzed} frames analyzed, original upload: {original_total_frames} frames, only first 200 processed)</p>
             </div>
             """, unsafe_allow_html=True)
         else:
             st.markdown(f"""
             <div class="info-box">
-                <p>No camera movement detected in the analyzed video ({len(frames)} frames analyzed)</p>
+                <p>No camera movement detected in the analyzed video ({num_analyzed} frames analyzed)</p>
             </div>
             """, unsafe_allow_html=True)
         st.markdown("""
@@ -199,36 +341,31 @@ def display_all_frames(frames, movement_indices=None, original_total_frames=None
         """, unsafe_allow_html=True)
 
 def create_simple_report(movement_data: Dict[str, Any], total_frames: int) -> str:
-    from datetime import datetime
+    # One f-string instead of a dozen list appends plus a join pass; the
+    # literal parts stay interned constants in the bytecode
     movement_indices = movement_data['movement_indices']
-    report = []
-    report.append("# Camera Movement Detection Report")
-    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
-    report.append("## Summary")
-    report.append(f"Total frames analyzed: {total_frames}")
-    report.append(f"Movement detected frames: {len(movement_indices)}")
     if movement_indices:
         movement_percentage = (len(movement_indices) / total_frames) * 100
-        report.append(f"Movement percentage: {movement_percentage:.1f}%")
-        report.append("Status: ✅ MOVEMENT DETECTED")
-        report.append("")
-        report.append("## Movement Frames")
-        report.append(f"Frames with movement: {', '.join(map(str, movement_indices))}")
+        status = "✅ MOVEMENT DETECTED"
+        frames_section = f"\n## Movement Frames\nFrames with movement: {', '.join(map(str, movement_indices))}\n"
     else:
-        report.append("Movement percentage: 0.0%")
-        report.append("Status: ❌ NO MOVEMENT DETECTED")
-    report.append("")
-    report.append("---")
-    report.append("Report generated by CamMotionDetect Pro")
-    return "\n".join(report)
-
-def image_to_base64(img):
-    _, buffer = cv2.imencode('.png', img)
-    return base64.b64encode(buffer).decode('utf-8')
+        movement_percentage = 0.0
+        status = "❌ NO MOVEMENT DETECTED"
+        frames_section = ""
+    return (f"# Camera Movement Detection Report\n"
+            f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n"
+            f"## Summary\n"
+            f"Total frames analyzed: {total_frames}\n"
+            f"Movement detected frames: {len(movement_indices)}\n"
+            f"Movement percentage: {movement_percentage:.1f}%\n"
+            f"Status: {status}\n"
+            f"{frames_section}\n"
+            f"---\n"
+            f"Report generated by CamMotionDetect Pro")
 
-def get_custom_css() -> str:
-    return """
+# Static style/markup blocks live at module scope so the per-rerun getters
+# hand back interned constants instead of rebuilding multi-KB strings
+_CUSTOM_CSS = """
     <style>
     .main {
         background-color: #f0f2f6;
@@ -291,9 +428,15 @@ def get_custom_css() -> str:
         margin-bottom: 1rem;
         border: 1px solid #dee2e6;
     }
+    .frame-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 8px;
+    }
     .movement-frame {
         border: 4px solid #ff5722;
         border-radius: 8px;
+        overflow: hidden;
     }
     .normal-frame {
         border: 1px solid #e0e0e0;
@@ -339,16 +482,20 @@ def get_custom_css() -> str:
     </style>
     """
 
-def get_title_html() -> str:
-    return """
+def get_custom_css() -> str:
+    return _CUSTOM_CSS
+
+_TITLE_HTML = """
     <div class="title-container">
         <h1>CamMotionDetect Pro</h1>
         <p class="subtitle">Advanced Camera Movement Detection System</p>
     </div>
     """
 
-def get_about_card_html() -> str:
-    return """
+def get_title_html() -> str:
+    return _TITLE_HTML
+
+_ABOUT_CARD_HTML = """
     <div class="card">
         <h3>About This Tool</h3>
         <p>This advanced system detects significant camera movement in image sequences or videos. 
@@ -360,17 +507,24 @@ def get_about_card_html() -> str:
     </div>
     """
 
-def get_info_box_html(text: str) -> str:
-    return f"""
+def get_about_card_html() -> str:
+    return _ABOUT_CARD_HTML
+
+_INFO_BOX_TMPL = """
     <div class="info-box">
-        <p>{text}</p>
+        <p>{}</p>
     </div>
     """
 
-def get_footer_html() -> str:
-    return """
+def get_info_box_html(text: str) -> str:
+    return _INFO_BOX_TMPL.format(text)
+
+_FOOTER_HTML = """
     <div class="footer">
         <p>CamMotionDetect Pro | Advanced Camera Movement Detection System</p>
         <p>Developed by ATP Core Talent 2025 Candidate</p>
     </div>
-    """ 
\ No newline at end of file
+    """
+
+def get_footer_html() -> str:
+    return _FOOTER_HTML
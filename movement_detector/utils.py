@@ -1,44 +1,114 @@
 import cv2
+import math
 import numpy as np
 import base64
 from typing import Any
 
-def image_to_base64(img: np.ndarray) -> str:
-    _, buffer = cv2.imencode('.png', img)
-    return base64.b64encode(buffer).decode('utf-8')
+# Optional accelerator, same pattern as scoring.py: with Numba the flow
+# displacement median is a single fused native kernel; otherwise NumPy.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-def calculate_frame_difference_score(prev_frame: np.ndarray, curr_frame: np.ndarray) -> float:
+# Fallback scores are driven by low-frequency content, so the scorers work on
+# quarter-resolution frames by default; the kernels are memory-bound, making
+# the saving roughly the square of the factor. Callers that pre-downsample
+# once per frame pair can pass scale=1.0 to skip the internal resize.
+SCORE_DOWNSAMPLE = 0.25
+
+# Scorer parameters hoisted to module constants: the per-frame-pair loop
+# then loads them once per call instead of rebuilding keyword literals
+_GFTT_KW = dict(maxCorners=100, qualityLevel=0.01, minDistance=10)
+_CANNY_LO, _CANNY_HI = 50, 150
+
+def downsample_for_scoring(frame: np.ndarray, scale: float = SCORE_DOWNSAMPLE) -> np.ndarray:
+    if scale >= 1.0:
+        return frame
+    return cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+def _flow_median_cv(old: np.ndarray, new: np.ndarray) -> float:
+    # cv2.magnitude fuses the hypot over both coordinates without the
+    # squared/summed temporaries linalg.norm built, and np.partition
+    # quickselects the median in O(K) instead of np.median's full sort
+    diff = (new - old).astype(np.float32)
+    disp = cv2.magnitude(np.ascontiguousarray(diff[:, 0]),
+                         np.ascontiguousarray(diff[:, 1])).ravel()
+    k = disp.size
+    half = k // 2
+    if k % 2:
+        return float(np.partition(disp, half)[half])
+    part = np.partition(disp, (half - 1, half))
+    return float(part[half - 1] + part[half]) / 2
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _flow_median(old, new):
+        # Fuses subtract, hypot and the median selection into one compiled
+        # pass over the (K, 2) corner arrays - no (K, 2) diff temporary
+        n = old.shape[0]
+        d = np.empty(n)
+        for i in range(n):
+            dx = new[i, 0] - old[i, 0]
+            dy = new[i, 1] - old[i, 1]
+            d[i] = math.sqrt(dx * dx + dy * dy)
+        return float(np.median(d))
+else:
+    _flow_median = _flow_median_cv
+
+def image_to_base64(img: np.ndarray, jpeg_quality: int = 85) -> str:
+    # JPEG at quality 85 encodes several times faster than PNG's zlib pass
+    # and produces far less base64 for the browser; callers embed the result
+    # with a data:image/jpeg;base64 prefix. base64 output is pure ASCII, so
+    # decode as such.
+    _, buffer = cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+    return base64.b64encode(buffer).decode('ascii')
+
+# The scorers only catch cv2.error (mismatched shapes/types reaching an
+# OpenCV kernel); bare except: handlers used to swallow genuine bugs too.
+
+def calculate_frame_difference_score(prev_frame: np.ndarray, curr_frame: np.ndarray, scale: float = SCORE_DOWNSAMPLE) -> float:
     try:
+        prev_frame = downsample_for_scoring(prev_frame, scale)
+        curr_frame = downsample_for_scoring(curr_frame, scale)
+        # cv2.compare/countNonZero/mean are SIMD kernels and avoid the
+        # boolean temporary that threshold + (thresh > 0) allocated
         diff = cv2.absdiff(prev_frame, curr_frame)
-        _, thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)
-        changed_pixels = np.sum(thresh > 0)
-        total_pixels = thresh.shape[0] * thresh.shape[1]
-        change_percentage = (changed_pixels / total_pixels) * 100
-        mean_diff = np.mean(diff)
+        changed_pixels = cv2.countNonZero(cv2.compare(diff, 25, cv2.CMP_GT))
+        change_percentage = (changed_pixels / diff.size) * 100
+        mean_diff = cv2.mean(diff)[0]
         return float(change_percentage + mean_diff * 0.1)
-    except:
+    except cv2.error:
         return 0.0
 
-def calculate_optical_flow_score(prev_frame: np.ndarray, curr_frame: np.ndarray) -> float:
+def calculate_optical_flow_score(prev_frame: np.ndarray, curr_frame: np.ndarray, scale: float = SCORE_DOWNSAMPLE) -> float:
     try:
-        corners = cv2.goodFeaturesToTrack(prev_frame, maxCorners=100, qualityLevel=0.01, minDistance=10)
-        if corners is not None and len(corners) > 10:
-            next_corners, status, error = cv2.calcOpticalFlowPyrLK(prev_frame, curr_frame, corners, None)
-            good_old = corners[status == 1]
-            good_new = next_corners[status == 1]
-            if len(good_old) > 5:
-                displacements = np.linalg.norm(good_new - good_old, axis=1)
-                return float(np.median(displacements) * 3)
-        return 0.0
-    except:
+        prev_frame = downsample_for_scoring(prev_frame, scale)
+        curr_frame = downsample_for_scoring(curr_frame, scale)
+        corners = cv2.goodFeaturesToTrack(prev_frame, **_GFTT_KW)
+        if corners is None or len(corners) <= 10:
+            return 0.0
+        next_corners, status, error = cv2.calcOpticalFlowPyrLK(prev_frame, curr_frame, corners, None)
+        good_old = corners[status == 1]
+        good_new = next_corners[status == 1]
+        if len(good_old) <= 5:
+            return 0.0
+        median = _flow_median(
+            np.ascontiguousarray(good_old, dtype=np.float64),
+            np.ascontiguousarray(good_new, dtype=np.float64))
+        # Rescale so the displacement stays in input-pixel units
+        return median / scale * 3
+    except cv2.error:
         return 0.0
 
-def calculate_edge_motion_score(prev_frame: np.ndarray, curr_frame: np.ndarray) -> float:
+def calculate_edge_motion_score(prev_frame: np.ndarray, curr_frame: np.ndarray, scale: float = SCORE_DOWNSAMPLE) -> float:
     try:
-        edges_prev = cv2.Canny(prev_frame, 50, 150)
-        edges_curr = cv2.Canny(curr_frame, 50, 150)
+        prev_frame = downsample_for_scoring(prev_frame, scale)
+        curr_frame = downsample_for_scoring(curr_frame, scale)
+        edges_prev = cv2.Canny(prev_frame, _CANNY_LO, _CANNY_HI)
+        edges_curr = cv2.Canny(curr_frame, _CANNY_LO, _CANNY_HI)
         edge_diff = cv2.absdiff(edges_prev, edges_curr)
         edge_motion = np.mean(edge_diff)
         return float(edge_motion * 0.5)
-    except:
-        return 0.0 
\ No newline at end of file
+    except cv2.error:
+        return 0.0
\ No newline at end of file